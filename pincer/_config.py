@@ -1,14 +1,30 @@
 # Copyright Pincer 2021-Present
 # Full MIT License can be found in `LICENSE` at the project root.
 
-from dataclasses import dataclass
+from functools import lru_cache
+
+_COMPRESSIONS = ("zlib-stream", "zlib-payload")
+
+
+@lru_cache(maxsize=None)
+def _build_uri(uri: str, version: int, encoding: str, compression: str) -> str:
+    """Builds the gateway uri once for every distinct configuration."""
+    return (
+        f"{uri}"
+        f"?v={version}"
+        f"&encoding={encoding}"
+    ) + f"&compress={compression}" * (compression in _COMPRESSIONS)
 
 
-@dataclass(repr=False)
 class GatewayConfig:
     """This file is to make maintaining the library and its gateway
     configuration easier. Leave compression blank for no compression.
+
+    The configuration is only ever read from the class itself, so it is
+    never instantiated.
     """
+    __slots__ = ()
+
     MAX_RETRIES: int = 5
     version: int = 9
     encoding: str = "json"
@@ -22,11 +38,7 @@ class GatewayConfig:
         :class:`str`:
             The GatewayConfig's uri.
         """
-        return (
-            f"{uri}"
-            f"?v={cls.version}"
-            f"&encoding={cls.encoding}"
-        ) + f"&compress={cls.compression}" * cls.compressed()
+        return _build_uri(uri, cls.version, cls.encoding, cls.compression)
 
     @classmethod
     def compressed(cls) -> bool:
@@ -36,4 +48,4 @@ class GatewayConfig:
         :class:`bool`:
             Whether the Gateway should compress payloads or not.
         """
-        return cls.compression in ["zlib-stream", "zlib-payload"]
+        return cls.compression in _COMPRESSIONS
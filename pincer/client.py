@@ -4,17 +4,22 @@
 from __future__ import annotations
 
 import logging
+import sys
 from asyncio import iscoroutinefunction, ensure_future, create_task, get_event_loop
-from collections import defaultdict
 from functools import partial
 from importlib import import_module
 from inspect import isasyncgenfunction
+from types import MappingProxyType
 from typing import (
     Any,
     Dict,
     List,
+    Mapping,
     Optional,
     Iterable,
+    FrozenSet,
+    NamedTuple,
+    Sequence,
     Tuple,
     Union,
     overload,
@@ -32,7 +37,7 @@ from .exceptions import (
     CogAlreadyExists,
     CogNotFound,
 )
-from .middleware import middleware
+from .middleware import middleware, skippable_middleware
 from .objects import (
     Role,
     Channel,
@@ -49,7 +54,6 @@ from .objects import (
 from .objects.guild.channel import GroupDMChannel
 from .utils.conversion import construct_client_dict, remove_none
 from .utils.event_mgr import EventMgr
-from .utils.extraction import get_index
 from .utils.insertion import should_pass_cls, should_pass_gateway
 from .utils.signature import get_params
 from .utils.types import CheckFunction
@@ -66,13 +70,74 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__package__)
 
-MiddlewareType = Optional[Union[Coro, Tuple[str, List[Any], Dict[str, Any]]]]
+# Shared defaults for middleware which don't return arguments, these
+# only get unpacked so they are never modified.
+_EMPTY_ARGS: Tuple[Any, ...] = ()
+_EMPTY_KWARGS: Mapping[str, Any] = MappingProxyType({})
 
-_event = Union[str, Coro]
-_events: Dict[str, Optional[Union[List[_event], _event]]] = defaultdict(list)
 
+class _EventHandler(NamedTuple):
+    """An ``on_`` event listener whose calling convention has been
+    resolved once at registration, instead of on every dispatch.
+    """
+    call: Coro
+    pass_cls: bool
+    pass_gateway: bool
+
+
+# Returned for events without handlers, instead of a new empty list.
+_NO_HANDLERS: Tuple[_EventHandler, ...] = ()
+
+
+class _EventEntry(NamedTuple):
+    """A slot in ``_events``, classified once when it gets created.
+
+    Middleware slots hold the middleware to invoke next, terminal slots
+    (``on_`` events) hold the handlers which are registered to the event.
+
+    Middleware which aren't ``required`` are skipped when nothing listens
+    to any of the ``on_`` events in ``terminals``, which are the events
+    the middleware can return.
+    """
+    middleware: Optional[Coro]
+    handlers: List[_EventHandler]
+    is_terminal: bool
+    required: bool = True
+    terminals: FrozenSet[str] = frozenset()
+
+
+_events: Dict[str, _EventEntry] = {}
 
-def event_middleware(call: str, *, override: bool = False):
+# Maps the event names sent by Discord (``MESSAGE_CREATE``) to their
+# interned ``_events`` key, so they aren't lowered for every payload.
+_event_keys: Dict[str, str] = {}
+
+
+def _get_terminal_entry(name: str) -> _EventEntry:
+    """Get the slot of an ``on_`` event, creating it if it doesn't exist.
+
+    Raises
+    ------
+    RuntimeError
+        The name is neither a middleware nor an ``on_`` event
+    """
+    if entry := _events.get(name):
+        return entry
+
+    if not name.startswith("on_"):
+        raise RuntimeError(f"Middleware `{name}` has not been registered.")
+
+    entry = _events[sys.intern(name)] = _EventEntry(None, [], True)
+    return entry
+
+
+def event_middleware(
+    call: str,
+    *,
+    override: bool = False,
+    required: bool = True,
+    events: Optional[Iterable[str]] = None
+):
     """Middleware are methods which can be registered with this decorator.
     These methods are invoked before any ``on_`` event.
     As the ``on_`` event is the final call.
@@ -122,9 +187,32 @@ def event_middleware(call: str, *, override: bool = False):
     override : :class:`bool`
         If it should override default middleware,
         usually shouldn't be used |default| :data:`False`
+    required : :class:`bool`
+        If the middleware must run even if no event listens to it,
+        for example because it updates the client its state. Overriding
+        a required middleware keeps it required. |default| :data:`True`
+    events : Optional[Iterable[:class:`str`]]
+        The ``on_`` events the middleware can return. A middleware which
+        isn't required is skipped when no event handler, ``wait_for`` or
+        ``loop_for`` listens to any of them. |default| ``(f"on_{call}",)``
+
+    Raises
+    ------
+    TypeError
+        If the middleware is not a coroutine function
+    RuntimeError
+        If middleware has already been registered for the call and
+        ``override`` is :data:`False`
     """
 
     def decorator(func: Coro):
+        # Checked once here, so dispatching doesn't have to check it for
+        # every payload.
+        if not iscoroutinefunction(func):
+            raise TypeError(
+                f"Middleware `{call}` must be a coroutine function"
+            )
+
         if override:
             _log.warning(
                 "Middleware overriding has been enabled for `%s`."
@@ -132,25 +220,51 @@ def event_middleware(call: str, *, override: bool = False):
                 call,
             )
 
-        if not override and callable(_events.get(call)):
-            raise RuntimeError(
-                f"Middleware event with call `{call}` has "
-                "already been registered"
-            )
+        entry = _events.get(call)
+        is_required = required
+
+        if entry and not entry.is_terminal:
+            if not override:
+                raise RuntimeError(
+                    f"Middleware event with call `{call}` has "
+                    "already been registered"
+                )
 
-        async def wrapper(cls, gateway: Gateway, payload: GatewayDispatch):
-            _log.debug("`%s` middleware has been invoked", call)
+            is_required = required or entry.required
 
-            return await func(cls, gateway, payload)
+        async def wrapper(
+            cls,
+            gateway: Gateway,
+            payload: GatewayDispatch,
+            *args,
+            **kwargs
+        ):
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug("`%s` middleware has been invoked", call)
+
+            return await func(cls, gateway, payload, *args, **kwargs)
 
-        _events[call] = wrapper
+        _events[sys.intern(call)] = _EventEntry(
+            wrapper,
+            [],
+            False,
+            is_required,
+            frozenset(events or (f"on_{call}",))
+        )
         return wrapper
 
     return decorator
 
 
 for event, middleware_ in middleware.items():
-    event_middleware(event)(middleware_)
+    terminal = skippable_middleware.get(event)
+
+    if terminal:
+        event_middleware(event, required=False, events=(terminal,))(
+            middleware_
+        )
+    else:
+        event_middleware(event)(middleware_)
 
 
 class Client:
@@ -313,13 +427,17 @@ class Client:
                 f"The event named `{name}` must start with `on_`"
             )
 
-        if name == "on_command_error" and _events.get(name):
+        if name == "on_command_error" and Client._get_event_handlers(name):
             raise InvalidEventName(
                 f"The `{name}` event can only exist once. This is because "
                 "it gets treated as a command and can have a response."
             )
 
-        _events[name].append(coroutine)
+        _get_terminal_entry(name).handlers.append(_EventHandler(
+            coroutine,
+            should_pass_cls(coroutine),
+            should_pass_gateway(coroutine)
+        ))
         return coroutine
 
     @staticmethod
@@ -331,16 +449,24 @@ class Client:
         name : :class:`str`
             name of the event
         """
-        calls = _events.get(name.strip().lower())
-
-        return (
-            [] if not calls
-            else [
-                call for call in calls
-                if iscoroutinefunction(call)
-                or isasyncgenfunction(call)
-            ]
-        )
+        return [
+            handler.call for handler in Client._get_event_handlers(name)
+        ]
+
+    @staticmethod
+    def _get_event_handlers(name: str) -> Sequence[_EventHandler]:
+        """get the registered handlers for an event
+
+        Parameters
+        ----------
+        name : :class:`str`
+            name of the event
+        """
+        # Events resolved by ``handle_middleware`` always have an entry, so
+        # the second lookup is only hit by user supplied names (which have
+        # to be stripped and lowered) and events nothing is registered to.
+        entry = _events.get(name) or _events.get(name.strip().lower())
+        return entry.handlers if entry else _NO_HANDLERS
 
     def load_cog(self, path: str, package: Optional[str] = None):
         """Load a cog from a string path, setup method in COG may
@@ -475,16 +601,48 @@ class Client:
         \\*\\*kwargs:
             The named arguments for the event.
         """
+        Client._execute_handlers(
+            [
+                _EventHandler(
+                    call, should_pass_cls(call), should_pass_gateway(call)
+                )
+                for call in calls
+            ],
+            gateway,
+            *args,
+            **kwargs
+        )
+
+    @staticmethod
+    def _execute_handlers(
+        handlers: Sequence[_EventHandler],
+        gateway: Gateway,
+        *args,
+        **kwargs
+    ):
+        """Invokes the handlers of an event, their calling convention has
+        been resolved when they got registered.
 
-        for call in calls:
+        Parameters
+        ----------
+        handlers: Sequence[:class:`_EventHandler`]
+            The handlers which are registered to the event.
+
+        \\*args:
+            The arguments for the event.
+
+        \\*\\*kwargs:
+            The named arguments for the event.
+        """
+        for call, pass_cls, pass_gateway in handlers:
             call_args = args
-            if should_pass_cls(call):
+            if pass_cls:
                 call_args = (
                     ChatCommandHandler.managers[call.__module__],
                     *remove_none(args),
                 )
 
-            if should_pass_gateway(call):
+            if pass_gateway:
                 call_args = (call_args[0], gateway, *call_args[1:])
 
             ensure_future(call(*call_args, **kwargs))
@@ -564,17 +722,16 @@ class Client:
         gateway: Gateway,
         *args,
         **kwargs
-    ) -> Tuple[Optional[Coro], List[Any], Dict[str, Any]]:
+    ) -> Tuple[str, Any]:
         """|coro|
 
-        Handles all middleware recursively. Stops when it has found an
-        event name which starts with ``on_``.
+        Handles all middleware iteratively. Stops when it has found a
+        terminal event, so one which starts with ``on_``.
 
         Returns a tuple where the first element is the final executor
         (so the event) its index in ``_events``.
 
-        The second and third element are the ``*args``
-        and ``**kwargs`` for the event.
+        The second element is the object which gets passed to the event.
 
         Parameters
         ----------
@@ -590,29 +747,31 @@ class Client:
         RuntimeError
             Middleware has not been registered
         """
-        ware: MiddlewareType = _events.get(key)
-        next_call, arguments, params = ware, [], {}
+        get_entry = _events.get
+        entry = get_entry(key)
 
-        if iscoroutinefunction(ware):
-            extractable = await ware(self, gateway, payload, *args, **kwargs)
+        if not entry or entry.is_terminal:
+            raise RuntimeError(f"Middleware `{key}` has not been registered.")
+
+        while True:
+            extractable = await entry.middleware(
+                self, gateway, payload, *args, **kwargs
+            )
 
             if not isinstance(extractable, tuple):
                 raise RuntimeError(
                     f"Return type from `{key}` middleware must be tuple. "
                 )
 
-            next_call = get_index(extractable, 0, "")
-            ret_object = get_index(extractable, 1)
+            length = len(extractable)
+            key = extractable[0] if length else ""
+            entry = get_entry(key) or _get_terminal_entry(key)
 
-        if next_call is None:
-            raise RuntimeError(f"Middleware `{key}` has not been registered.")
+            if entry.is_terminal:
+                return key, extractable[1] if length > 1 else None
 
-        if next_call.startswith("on_"):
-            return (next_call, ret_object)
-
-        return await self.handle_middleware(
-            payload, next_call, gateway, *arguments, **params
-        )
+            args = extractable[1] if length > 1 else _EMPTY_ARGS
+            kwargs = extractable[2] if length > 2 else _EMPTY_KWARGS
 
     async def execute_error(
         self,
@@ -636,13 +795,40 @@ class Client:
         Raises
         ------
         error
-            if ``call := self.get_event_coro(name)`` is :data:`False`
+            if ``handlers := self._get_event_handlers(name)`` is :data:`False`
         """
-        if calls := self.get_event_coro(name):
-            self.execute_event(calls, gateway, error, *args, **kwargs)
+        if handlers := self._get_event_handlers(name):
+            self._execute_handlers(handlers, gateway, error, *args, **kwargs)
         else:
             raise error
 
+    def _is_listened_to(self, name: str) -> bool:
+        """Whether the middleware registered as ``name`` has to run.
+
+        This is the case when it is required or when an event handler,
+        ``wait_for`` or ``loop_for`` listens to one of the events it can
+        return. Unknown names have to run so that they raise.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The name of the middleware.
+        """
+        entry = _events.get(name)
+
+        if not entry or entry.required:
+            return True
+
+        # The declared events are exact keys, so unlike
+        # ``_get_event_handlers`` a miss doesn't need to be normalized.
+        get_entry = _events.get
+
+        return any(
+            (terminal := get_entry(key)) and terminal.handlers
+            or self.event_mgr.is_waiting_for(key)
+            for key in entry.terminals
+        )
+
     async def process_event(
         self,
         name: str,
@@ -663,12 +849,15 @@ class Client:
             required data for the client to know what event it is and
             what specifically happened.
         """
+        if not self._is_listened_to(name):
+            return
+
         try:
             key, args = await self.handle_middleware(payload, name, gateway)
             self.event_mgr.process_events(key, args)
 
-            if calls := self.get_event_coro(key):
-                self.execute_event(calls, gateway, args)
+            if handlers := self._get_event_handlers(key):
+                self._execute_handlers(handlers, gateway, args)
 
         except Exception as e:
             await self.execute_error(e, gateway)
@@ -692,7 +881,13 @@ class Client:
             required data for the client to know what event it is and
             what specifically happened.
         """
-        await self.process_event(payload.event_name.lower(), payload, gateway)
+        name = payload.event_name
+        key = _event_keys.get(name)
+
+        if key is None:
+            key = _event_keys[name] = sys.intern(name.lower())
+
+        await self.process_event(key, payload, gateway)
 
     async def payload_event_handler(
         self,
@@ -27,7 +27,14 @@ class ActionRow(APIObject):
         self.components = components
 
     def to_dict(self) -> Dict:
+        components = self.components
+
+        # Most rows only hold a single button or select menu.
         return {
             "type": 1,
-            "components": [component.to_dict() for component in self.components]
+            "components": (
+                [components[0].to_dict()]
+                if len(components) == 1
+                else [component.to_dict() for component in components]
+            )
         }
@@ -275,18 +275,27 @@ class Gateway:
         if op_negative_one:
             ensure_future(op_negative_one(payload))
 
-        _log.debug(
-            "%s %s GatewayDispatch with opcode %s received",
-            self.shard_key,
-            datetime.now(),
-            payload.op
-        )
+        # Checked up front since this runs for every payload and
+        # ``datetime.now()`` would otherwise be evaluated for nothing.
+        debug = _log.isEnabledFor(logging.DEBUG)
+
+        if debug:
+            _log.debug(
+                "%s %s GatewayDispatch with opcode %s received",
+                self.shard_key,
+                datetime.now(),
+                payload.op
+            )
 
         # Many events are sent with a `null` sequence. This sequence should not
         # be tracked.
         if payload.seq is not None:
             self.__sequence_number = payload.seq
-            _log.debug("%s Set sequence number to %s", self.shard_key, payload.seq)
+
+            if debug:
+                _log.debug(
+                    "%s Set sequence number to %s", self.shard_key, payload.seq
+                )
 
         handler = self.__dispatch_handlers.get(payload.op)
 
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging
 from asyncio import sleep
-from json import dumps
 from typing import Protocol, TYPE_CHECKING
 
 from aiohttp import ClientSession, ClientResponse
@@ -29,6 +28,20 @@ if TYPE_CHECKING:
     from aiohttp.typedefs import StrOrURL
 
 
+ORJSON_IMPORT = True
+
+try:
+    from orjson import dumps as _orjson_dumps, OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        # orjson encodes straight to the bytes aiohttp sends, instead of
+        # building a str which aiohttp has to encode again.
+        return _orjson_dumps(obj, option=OPT_NON_STR_KEYS)
+except (ModuleNotFoundError, ImportError):
+    ORJSON_IMPORT = False
+    from json import dumps
+
+
 _log = logging.getLogger(__package__)
 
 
@@ -113,7 +126,7 @@ class HTTPClient:
             method: HttpCallable,
             endpoint: str, *,
             content_type: str = "application/json",
-            data: Optional[Union[Dict, str, Payload]] = None,
+            data: Optional[Union[Dict, str, bytes, Payload]] = None,
             headers: Optional[Dict[str, Any]] = None,
             _ttl: Optional[int] = None,
             params: Optional[Dict] = None,
@@ -133,8 +146,10 @@ class HTTPClient:
         content_type: :class:`str`
             The request's content type.
 
-        data: Optional[Union[:class:`Dict`, :class:`str`, :class:`aiohttp.payload.Payload`]]
-            The data which will be added to the request.
+        data: Optional[Union[:class:`Dict`, :class:`str`, :class:`bytes`]]
+            The data which will be added to the request, this can also be
+            an :class:`aiohttp.payload.Payload`. Dictionaries are encoded
+            with ``orjson`` if it is installed.
             |default| :data:`None`
 
         headers: Optional[:class:`Dict`]
@@ -166,7 +181,8 @@ class HTTPClient:
 
         # TODO: print better method name
         # TODO: Adjust to work non-json types
-        _log.debug(f"{method.__name__.upper()} {endpoint} | {data}")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(f"{method.__name__.upper()} {endpoint} | {data}")
 
         await self.__rate_limiter.wait_until_not_ratelimited(
             endpoint,
@@ -193,7 +209,7 @@ class HTTPClient:
             method: HttpCallable,
             endpoint: str,
             content_type: str,
-            data: Optional[str],
+            data: Optional[Union[str, bytes]],
             _ttl: int,
     ) -> Optional[Dict]:
         """
@@ -217,14 +233,16 @@ class HTTPClient:
         content_type: :class:`str`
             The request's content type.
 
-        data: Optional[:class:`str`]
+        data: Optional[Union[:class:`str`, :class:`bytes`]]
             The data which was added to the request.
 
         _ttl: :class:`int`
             Private param used for recursively setting the retry amount.
             (Eg set to 1 for 1 max retry)
         """
-        _log.debug(f"Received response for {endpoint} | {await res.text()}")
+        # Reading the body as text is only needed for the debug log.
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(f"Received response for {endpoint} | {await res.text()}")
 
         self.__rate_limiter.save_response_bucket(
             endpoint, method, res.headers
@@ -49,3 +49,42 @@ def get_middleware() -> Dict[str, Coro]:
 
 
 middleware: Dict[str, Coro] = get_middleware()
+
+# Middleware which only build the event they return, mapped to that event.
+# Events which belong to state the client keeps (the bot user, guilds and
+# their channels, members, presences, roles, emojis, stickers, threads and
+# voice states) are left out even if their middleware doesn't update it yet.
+# These are skipped when no event, ``wait_for`` or ``loop_for`` listens to
+# the event. Every other middleware always runs.
+skippable_middleware: Dict[str, str] = {
+    "activity_join": "on_activity_join",
+    "activity_join_request": "on_activity_join_request",
+    "activity_spectate": "on_activity_spectate",
+    "guild_ban_add": "on_guild_ban_add",
+    "guild_ban_remove": "on_guild_ban_remove",
+    "guild_integrations_update": "on_guild_integrations_update",
+    "guild_status": "on_guild_status",
+    "integration_create": "on_integration_create",
+    "integration_delete": "on_integration_delete",
+    "integration_update": "on_integration_update",
+    "invite_create": "on_invite_create",
+    "invite_delete": "on_invite_delete",
+    "message_create": "on_message",
+    "message_delete": "on_message_delete",
+    "message_delete_bulk": "on_message_delete_bulk",
+    "message_reaction_add": "on_message_reaction_add",
+    "message_reaction_remove": "on_message_reaction_remove",
+    "message_reaction_remove_all": "on_message_reaction_remove_all",
+    "message_reaction_remove_emoji": "on_message_reaction_remove_emoji",
+    "message_update": "on_message_update",
+    "notification_create": "on_notification_create",
+    "payload": "on_payload",
+    "speaking_start": "on_speaking_start",
+    "speaking_stop": "on_speaking_stop",
+    "typing_start": "on_typing_start",
+    "voice_channel_select": "on_voice_channel_select",
+    "voice_connection_status": "on_voice_connection_status",
+    "voice_server_update": "on_voice_server_update",
+    "voice_settings_update": "on_voice_settings_update",
+    "webhooks_update": "on_webhooks_update",
+}
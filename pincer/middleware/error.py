@@ -20,7 +20,7 @@ if TYPE_CHECKING:
     from ..core.gateway import GatewayDispatch
 
 
-def error_middleware(
+async def error_middleware(
     self: Client,
     gateway: Gateway,
     payload: GatewayDispatch
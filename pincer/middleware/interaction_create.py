@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import logging
 from contextlib import suppress
+from functools import lru_cache
 from inspect import isasyncgenfunction, _empty
 from typing import TYPE_CHECKING
 
@@ -83,6 +84,42 @@ def get_command_from_registry(interaction: Interaction):
     )
 
 
+@lru_cache(maxsize=None)
+def _should_pass_ctx(command: Coro) -> bool:
+    """Cached :func:`~pincer.utils.insertion.should_pass_ctx` for a
+    command, as its annotations don't change between interactions.
+    """
+    return should_pass_ctx(*get_signature_and_params(command))
+
+
+@lru_cache(maxsize=None)
+def _should_pass_cls(command: Coro) -> bool:
+    """Cached :func:`~pincer.utils.insertion.should_pass_cls` for a
+    command.
+    """
+    return should_pass_cls(command)
+
+
+@lru_cache(maxsize=None)
+def _is_async_gen(command: Coro) -> bool:
+    """Cached :func:`inspect.isasyncgenfunction` for a command."""
+    return isasyncgenfunction(command)
+
+
+@lru_cache(maxsize=None)
+def _get_defaults(command: Coro) -> Dict[str, Any]:
+    """The default values of the parameters of a command, these are
+    cached so the returned dictionary must be copied before modifying it.
+    """
+    sig, _ = get_signature_and_params(command)
+
+    return {
+        key: value.default
+        for key, value in sig.items()
+        if value.default is not _empty
+    }
+
+
 def get_call(self: Client, interaction: Interaction):
     if interaction.type == InteractionType.APPLICATION_COMMAND:
         command = get_command_from_registry(interaction)
@@ -121,14 +158,13 @@ async def interaction_response_handler(
     \\*\\*kwargs :
         The arguments to be passed to the command.
     """
-    sig, params = get_signature_and_params(command)
-    if should_pass_ctx(sig, params):
+    if _should_pass_ctx(command):
         args.insert(0, context)
 
-    if should_pass_cls(command):
+    if _should_pass_cls(command):
         args.insert(0, ChatCommandHandler.managers[command.__module__])
 
-    if isasyncgenfunction(command):
+    if _is_async_gen(command):
         message = command(*args, **kwargs)
 
         async for msg in message:
@@ -142,6 +178,16 @@ async def interaction_response_handler(
             await interaction.reply(message)
 
 
+def _get_options_from_command(options):
+    if not options:
+        return options
+    if options[0].type == 1:
+        return options[0].options
+    if options[0].type == 2:
+        return _get_options_from_command(options[0].options)
+    return options
+
+
 async def interaction_handler(
     interaction: Interaction, context: MessageContext, command: Coro
 ):
@@ -158,50 +204,34 @@ async def interaction_handler(
     command : :class:`~pincer.utils.types.Coro`
         The coroutine which will be seen as a command.
     """
-    sig, _ = get_signature_and_params(command)
+    data = interaction.data
+    kwargs = _get_defaults(command).copy()
 
-    defaults = {
-        key: value.default
-        for key, value in sig.items()
-        if value.default is not _empty
-    }
-    params = {}
-
-    def get_options_from_command(options):
-        if not options:
-            return options
-        if options[0].type == 1:
-            return options[0].options
-        if options[0].type == 2:
-            return get_options_from_command(options[0].options)
-        return options
-
-    options = get_options_from_command(interaction.data.options)
+    options = _get_options_from_command(data.options)
 
     if options is not MISSING:
-        params = {opt.name: opt.value for opt in options}
+        kwargs.update((opt.name, opt.value) for opt in options)
 
     args = []
+    command_type = data.type
 
-    if interaction.data.type == AppCommandType.USER:
+    if command_type == AppCommandType.USER:
         # Add User and Member args
-        user = next(iter(interaction.data.resolved.users.values()))
+        user = next(iter(data.resolved.users.values()))
 
-        if members := interaction.data.resolved.members:
+        if members := data.resolved.members:
             member = next(iter(members.values()))
             member.set_user_data(user)
             args.append(member)
         else:
             args.append(user)
 
-    elif interaction.data.type == AppCommandType.MESSAGE:
+    elif command_type == AppCommandType.MESSAGE:
         # Add Message to args
-        args.append(next(iter(interaction.data.resolved.messages.values())))
-
-    if interaction.data.values:
-        args.append(interaction.data.values)
+        args.append(next(iter(data.resolved.messages.values())))
 
-    kwargs = {**defaults, **params}
+    if values := data.values:
+        args.append(values)
 
     await interaction_response_handler(
         command, context, interaction, args, kwargs
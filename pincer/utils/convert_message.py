@@ -43,7 +43,16 @@ def convert_message(client: Client, message: MessageConvertable) -> Message:
     :class:`~pincer.objects.message.message.Message`
         The message object to be sent
     """
-    if message and isinstance(message, Iterable) and not isinstance(message, str):
+    # Messages are returned as is, and strings are ruled out before the
+    # (slow) ``Iterable`` ABC check.
+    if isinstance(message, Message):
+        return message
+
+    if (
+        message
+        and not isinstance(message, str)
+        and isinstance(message, Iterable)
+    ):
         kwargs = defaultdict(list)
         for item in message:
             list_to_message_dict(item, kwargs)
@@ -52,7 +61,7 @@ def convert_message(client: Client, message: MessageConvertable) -> Message:
         message = Message(embeds=[message])
     elif PILLOW_IMPORT and isinstance(message, (File, Image)):
         message = Message(attachments=[message])
-    elif not isinstance(message, Message):
+    else:
         message = (
             Message(message)
             if message
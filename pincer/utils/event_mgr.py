@@ -212,6 +212,20 @@ class EventMgr:
         for event in self.event_list:
             event.process(event_name, event_value)
 
+    def is_waiting_for(self, event_name: str) -> bool:
+        """
+        Parameters
+        ----------
+        event_name : str
+            The name of the event.
+
+        Returns
+        -------
+        bool
+            Whether a ``wait_for`` or ``loop_for`` is waiting for the event.
+        """
+        return any(event.event_name == event_name for event in self.event_list)
+
     async def wait_for(
         self,
         event_name: str,
@@ -0,0 +1,34 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from pincer.commands import ActionRow, Button, ButtonStyle
+
+
+class TestActionRow:
+
+    def test_to_dict(self):
+        button = Button(custom_id="a", label="A", style=ButtonStyle.PRIMARY)
+
+        assert ActionRow(button, button).to_dict() == {
+            "type": 1,
+            "components": [button.to_dict(), button.to_dict()]
+        }
+
+    def test_mutated_component(self):
+        button = Button(custom_id="a", label="A", style=ButtonStyle.PRIMARY)
+        row = ActionRow(button)
+        row.to_dict()
+
+        button.label = "B"
+        button.disabled = True
+
+        component = row.to_dict()["components"][0]
+        assert component["label"] == "B"
+        assert component["disabled"] is True
+
+    def test_modified_result(self):
+        button = Button(custom_id="a", label="A", style=ButtonStyle.PRIMARY)
+        row = ActionRow(button)
+
+        row.to_dict()["components"].clear()
+        assert len(row.to_dict()["components"]) == 1
@@ -0,0 +1,63 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+import json
+
+import pytest
+
+from pincer.core import http
+from pincer.core.http import HTTPClient
+
+
+class FakeResponse:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class FakeMethod:
+    __name__ = "post"
+
+    def __init__(self):
+        self.sent = []
+
+    def __call__(self, url, *, data=None, **kwargs):
+        self.sent.append(data)
+        return FakeResponse()
+
+
+async def send(data):
+    method = FakeMethod()
+
+    async def handle_response(res, method, endpoint, *args):
+        pass
+
+    async with HTTPClient("token") as client:
+        client._HTTPClient__handle_response = handle_response
+        await client._HTTPClient__send(method, "channels/1", data=data)
+
+    return method.sent[0]
+
+
+class TestHTTPClient:
+    data = {"content": "Pincer ✓", "embeds": [{"fields": []}], 1: None}
+
+    @pytest.mark.asyncio
+    async def test_bytes_unchanged(self):
+        data = b'{"content": "Pincer"}'
+
+        assert await send(data) is data
+
+    @pytest.mark.asyncio
+    async def test_dict_encoding(self, monkeypatch):
+        pytest.importorskip("orjson")
+        assert http.ORJSON_IMPORT
+
+        with_orjson = await send(dict(self.data))
+        monkeypatch.setattr(http, "dumps", json.dumps)
+        without_orjson = await send(dict(self.data))
+
+        assert isinstance(with_orjson, bytes)
+        assert json.loads(with_orjson) == json.loads(without_orjson)
@@ -0,0 +1,38 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+import asyncio
+
+import pytest
+
+from pincer.client import Client, _events
+from pincer.core.dispatch import GatewayDispatch
+from pincer.objects.events.error import DiscordError
+from pincer.utils.event_mgr import EventMgr
+
+
+class TestErrorMiddleware:
+
+    @pytest.mark.asyncio
+    async def test_dispatch(self):
+        client = Client.__new__(Client)
+        client.event_mgr = EventMgr()
+        errors = []
+
+        @Client.event
+        async def on_error(error):
+            errors.append(error)
+
+        try:
+            await client.process_event(
+                "error",
+                GatewayDispatch(0, {"code": 4000, "message": "Unknown"}),
+                None
+            )
+            await asyncio.sleep(0)
+        finally:
+            del _events["on_error"]
+
+        assert len(errors) == 1
+        assert isinstance(errors[0], DiscordError)
+        assert (errors[0].code, errors[0].message) == (4000, "Unknown")
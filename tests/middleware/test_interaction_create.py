@@ -0,0 +1,43 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from types import SimpleNamespace
+
+import pytest
+
+from pincer.middleware.interaction_create import interaction_handler
+from pincer.objects import AppCommandType
+from pincer.utils import MISSING
+
+
+class FakeInteraction:
+    def __init__(self, options):
+        self.data = SimpleNamespace(
+            options=options,
+            type=AppCommandType.CHAT_INPUT,
+            values=MISSING
+        )
+        self.has_replied = False
+        self.replies = []
+
+    async def reply(self, message):
+        self.replies.append(message)
+
+
+class TestInteractionHandler:
+
+    @pytest.mark.asyncio
+    async def test_defaults_not_shared(self):
+        async def command(name="default"):
+            return name
+
+        given = FakeInteraction(
+            [SimpleNamespace(type=3, name="name", value="given")]
+        )
+        missing = FakeInteraction(MISSING)
+
+        await interaction_handler(given, None, command)
+        await interaction_handler(missing, None, command)
+
+        assert given.replies == ["given"]
+        assert missing.replies == ["default"]
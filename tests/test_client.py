@@ -0,0 +1,187 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+import asyncio
+
+import pytest
+
+from pincer.client import Client, _events, event_middleware
+from pincer.core.dispatch import GatewayDispatch
+from pincer.middleware import middleware, skippable_middleware
+from pincer.utils.event_mgr import EventMgr
+
+
+@pytest.fixture
+def client():
+    client = Client.__new__(Client)
+    client.event_mgr = EventMgr()
+    return client
+
+
+@pytest.fixture
+def calls():
+    calls = []
+    registered = set(_events)
+    yield calls
+
+    for key in set(_events) - registered:
+        del _events[key]
+
+
+def register(calls, call, **kwargs):
+    @event_middleware(call, **kwargs)
+    async def test_middleware(self, gateway, payload):
+        calls.append(call)
+        return payload.data, None
+
+    return test_middleware
+
+
+def dispatch(event):
+    return GatewayDispatch(0, event)
+
+
+class TestEventMiddleware:
+
+    @pytest.mark.asyncio
+    async def test_skipped_without_listeners(self, client, calls):
+        register(calls, "test_skippable", required=False)
+
+        await client.process_event(
+            "test_skippable", dispatch("on_test_skippable"), None
+        )
+
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_runs_for_wait_for(self, client, calls):
+        register(
+            calls,
+            "test_skippable",
+            required=False,
+            events=("on_test_first", "on_test_second")
+        )
+
+        waiting = asyncio.create_task(
+            client.event_mgr.wait_for("on_test_second", None, 1)
+        )
+        await asyncio.sleep(0)
+
+        await client.process_event(
+            "test_skippable", dispatch("on_test_second"), None
+        )
+
+        assert calls == ["test_skippable"]
+        await waiting
+        assert not client.event_mgr.is_waiting_for("on_test_second")
+
+    @pytest.mark.asyncio
+    async def test_required_always_runs(self, client, calls):
+        register(calls, "test_required")
+
+        await client.process_event(
+            "test_required", dispatch("on_test_required"), None
+        )
+
+        assert calls == ["test_required"]
+
+    @pytest.mark.asyncio
+    async def test_override_keeps_required(self, client, calls):
+        register(calls, "test_required")
+        register(calls, "test_required", override=True, required=False)
+
+        assert _events["test_required"].required
+
+        await client.process_event(
+            "test_required", dispatch("on_test_required"), None
+        )
+
+        assert calls == ["test_required"]
+
+    def test_sync_middleware(self):
+        def test_sync(self, gateway, payload):
+            return "on_test_sync", None
+
+        with pytest.raises(TypeError):
+            event_middleware("test_sync")(test_sync)
+
+        assert "test_sync" not in _events
+
+    def test_builtin_middleware_required(self):
+        for call in middleware:
+            assert _events[call].required is (
+                call not in skippable_middleware
+            )
+
+        assert _events["message_create"].terminals == {"on_message"}
+        assert _events["guild_emojis_update"].required
+
+
+class TestHandleMiddleware:
+
+    @pytest.mark.asyncio
+    async def test_chained_arguments(self, client, calls):
+        @event_middleware("test_first")
+        async def first(self, gateway, payload):
+            return "test_second", ["a"], {"b": "c"}
+
+        @event_middleware("test_second")
+        async def second(self, gateway, payload, *args, **kwargs):
+            calls.append((args, kwargs))
+            return "on_test_second", payload.data
+
+        key, args = await client.handle_middleware(
+            dispatch("value"), "test_first", None
+        )
+
+        assert (key, args) == ("on_test_second", "value")
+        assert calls == [(("a",), {"b": "c"})]
+
+    @pytest.mark.asyncio
+    async def test_non_tuple_return(self, client, calls):
+        @event_middleware("test_first")
+        async def first(self, gateway, payload):
+            return "on_test_first"
+
+        with pytest.raises(RuntimeError):
+            await client.handle_middleware(
+                dispatch(None), "test_first", None
+            )
+
+    @pytest.mark.asyncio
+    async def test_unknown_key_to_on_error(self, client, calls):
+        @event_middleware("test_first")
+        async def first(self, gateway, payload):
+            return ("test_unknown",)
+
+        @Client.event
+        async def on_error(error):
+            calls.append(error)
+
+        await client.process_event("test_first", dispatch(None), None)
+        await asyncio.sleep(0)
+
+        assert len(calls) == 1
+        assert isinstance(calls[0], RuntimeError)
+        assert "test_unknown" in str(calls[0])
+
+
+class TestExecuteEvent:
+
+    @pytest.mark.asyncio
+    async def test_execute_event_calls(self):
+        received = []
+
+        @Client.event
+        async def on_test_execute(value):
+            received.append(value)
+
+        try:
+            Client.execute_event(
+                Client.get_event_coro("on_test_execute"), None, "value"
+            )
+            await asyncio.sleep(0)
+        finally:
+            _events.pop("on_test_execute")
+
+        assert received == ["value"]
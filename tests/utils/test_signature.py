@@ -0,0 +1,18 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from pincer.utils import get_params
+
+
+async def command(self, ctx, amount: int = 1):
+    ...
+
+
+class TestSignature:
+
+    def test_get_params(self):
+        assert get_params(command) == ["ctx", "amount"]
+
+    def test_params_are_not_shared(self):
+        get_params(command).append("junk")
+        assert get_params(command) == ["ctx", "amount"]